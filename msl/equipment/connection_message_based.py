@@ -233,6 +233,46 @@ class ConnectionMessageBased(Connection):
             time.sleep(delay)
         return self.read(size=size)
 
+    def query_many(self, messages, delay=0.0, separator=None):
+        """Write many messages to the equipment and then read all of the responses.
+
+        The messages are written back to back, in a single :meth:`write` operation,
+        before any of the responses are read. This avoids waiting for a round trip
+        between the computer and the equipment for every message. The equipment must
+        be able to buffer all of the messages and it must send a response, terminated
+        by :attr:`.read_termination`, for each message.
+
+        Parameters
+        ----------
+        messages : :class:`list` of :class:`str`
+            The messages to write to the equipment.
+        delay : :class:`float`, optional
+            The time delay, in seconds, to wait between the :meth:`write`
+            and :meth:`read` operations.
+        separator : :class:`str`, optional
+            If specified then join all `messages` with this character sequence,
+            write them to the equipment as a single message and split the single
+            response from the equipment using the same character sequence. For example,
+            equipment that supports SCPI can use ``';'`` to query many settings
+            with a single message. The responses must not contain `separator`.
+
+        Returns
+        -------
+        :class:`list` of :class:`str`
+            The responses from the equipment, in the same order as `messages`.
+        """
+        if not messages:
+            return []
+
+        if separator is not None:
+            reply = self.query(separator.join(messages), delay=delay)
+            return reply.split(separator)
+
+        self.write(b''.join(self._encode(msg) for msg in messages))
+        if delay > 0.0:
+            time.sleep(delay)
+        return [self.read() for _ in messages]
+
     def _encode_termination(self, termination):
         # convenience method for setting a termination encoding
         if termination is not None:
@@ -63,6 +63,8 @@ class ConnectionSerial(ConnectionMessageBased):
         self._serial = serial.Serial()
         super(ConnectionSerial, self).__init__(record)
 
+        self._byte_buffer = bytearray()
+
         info = ConnectionSerial.parse_address(record.connection.address)
         if info is None:
             self.raise_exception('Invalid address {!r}'.format(record.connection.address))
@@ -120,6 +122,15 @@ class ConnectionSerial(ConnectionMessageBased):
         """:class:`serial.Serial`: The reference to the serial object."""
         return self._serial
 
+    @property
+    def byte_buffer(self):
+        """:class:`bytearray`: Returns the reference to the byte buffer.
+
+        Contains the bytes that have been received from the serial port
+        but have not been returned by :meth:`read` yet.
+        """
+        return self._byte_buffer
+
     @property
     def baud_rate(self):
         """:class:`int`: The baud rate setting."""
@@ -202,25 +213,37 @@ class ConnectionSerial(ConnectionMessageBased):
                     self._max_read_size, size)
                 )
 
-            out = self._serial.read(size)
+            if len(self._byte_buffer) < size:
+                self._byte_buffer.extend(self._serial.read(size - len(self._byte_buffer)))
+
+            out = self._byte_buffer[:size]
+            del self._byte_buffer[:size]
             if len(out) != size:
                 self.raise_exception('received {} bytes, requested {} bytes'.format(len(out), size))
 
         else:
             t0 = time.time()
-            out = bytearray()
+            start = 0
             while True:
-                out.extend(self._serial.read(1))
-
-                if self._read_termination and out.endswith(self._read_termination):
-                    out = out[:-len(self._read_termination)]
-                    break
-
-                if len(out) > self._max_read_size:
+                if self._read_termination:
+                    # only search the bytes that have not already been searched
+                    index = self._byte_buffer.find(self._read_termination, start)
+                    if index != -1:
+                        out = self._byte_buffer[:index]
+                        del self._byte_buffer[:index + len(self._read_termination)]
+                        break
+                    start = max(0, len(self._byte_buffer) - len(self._read_termination) + 1)
+
+                if len(self._byte_buffer) > self._max_read_size:
+                    n = len(self._byte_buffer)
+                    del self._byte_buffer[:]
                     self.raise_exception('len(bytes_read) [{}] > max_read_size [{}]'.format(
-                        len(out), self._max_read_size)
+                        n, self._max_read_size)
                     )
 
+                # read all bytes that are waiting, otherwise block until at least 1 byte is available
+                self._byte_buffer.extend(self._serial.read(self._serial.in_waiting or 1))
+
                 if self._timeout and time.time() - t0 >= self._timeout:
                     self.raise_timeout()
 
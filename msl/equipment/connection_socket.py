@@ -54,13 +54,16 @@ class ConnectionSocket(ConnectionMessageBased):
         self._socket = None
         super(ConnectionSocket, self).__init__(record)
 
+        # the bytes in `_byte_buffer` before `_byte_offset` have already been read
         self._byte_buffer = bytearray()
+        self._byte_offset = 0
 
         # TODO consider using the `select` module for asynchronous I/O behaviour
 
         props = record.connection.properties
 
         self._buffer_size = props.get('buffer_size', 4096)
+        self._recv_buffer = memoryview(bytearray(self._buffer_size))
 
         if 'family' in props:
             family = props['family'].upper()
@@ -125,8 +128,15 @@ class ConnectionSocket(ConnectionMessageBased):
     @property
     def byte_buffer(self):
         """:class:`bytearray`: Returns the reference to the byte buffer."""
+        self._compact_byte_buffer()
         return self._byte_buffer
 
+    def _compact_byte_buffer(self):
+        # remove the bytes that have already been read from the byte buffer
+        if self._byte_offset > 0:
+            del self._byte_buffer[:self._byte_offset]
+            self._byte_offset = 0
+
     @property
     def host(self):
         """:class:`str`: The host (IP address)."""
@@ -210,41 +220,54 @@ class ConnectionSocket(ConnectionMessageBased):
             )
 
         t0 = time.time()
+        start = self._byte_offset
         timeout_error = False
         while True:
 
             if size is not None:
-                if len(self._byte_buffer) >= size:
-                    out = self._byte_buffer[:size]
-                    self._byte_buffer = self._byte_buffer[size:]
+                if len(self._byte_buffer) - self._byte_offset >= size:
+                    end = self._byte_offset + size
+                    out = self._byte_buffer[self._byte_offset:end]
+                    self._byte_offset = end
                     break
 
             elif self._read_termination:
-                index = self._byte_buffer.find(self._read_termination)
+                # only search the bytes that have not already been searched
+                index = self._byte_buffer.find(self._read_termination, start)
                 if not index == -1:
-                    out = self._byte_buffer[:index]
-                    index += len(self._read_termination)
-                    self._byte_buffer = self._byte_buffer[index:]
+                    out = self._byte_buffer[self._byte_offset:index]
+                    self._byte_offset = index + len(self._read_termination)
                     break
+                start = max(self._byte_offset, len(self._byte_buffer) - len(self._read_termination) + 1)
+
+            # the unread bytes are moved to the front of the byte buffer only when
+            # the read bytes occupy at least half of the buffer, rather than for
+            # every message, so that a burst of many messages is not O(n^2)
+            if self._byte_offset > len(self._byte_buffer) // 2:
+                start -= self._byte_offset
+                self._compact_byte_buffer()
 
             try:
                 if self._is_stream:
-                    data = self._socket.recv(self._buffer_size)
+                    n = self._socket.recv_into(self._recv_buffer)
                 else:
-                    data, _ = self._socket.recvfrom(self._buffer_size)
+                    n, _ = self._socket.recvfrom_into(self._recv_buffer)
             except socket.timeout:
                 timeout_error = True  # want to raise MSLTimeoutError not socket.timeout
             else:
-                self._byte_buffer.extend(data)
+                self._byte_buffer += self._recv_buffer[:n]
 
-            if len(self._byte_buffer) > self._max_read_size:
+            if len(self._byte_buffer) - self._byte_offset > self._max_read_size:
                 self.raise_exception('len(byte_buffer) [{}] > max_read_size [{}]'.format(
-                    len(self._byte_buffer), self._max_read_size)
+                    len(self._byte_buffer) - self._byte_offset, self._max_read_size)
                 )
 
             if timeout_error or (self._timeout and (time.time() - t0 > self._timeout)):
                 self.raise_timeout()
 
+        if self._byte_offset == len(self._byte_buffer):
+            self._compact_byte_buffer()
+
         return self._decode(size, out)
 
     def reconnect(self, max_attempts=1):
@@ -424,6 +424,7 @@ class SHOT702(ConnectionSerial):
         if reply == 'NG':  # then try again
             self.serial.reset_input_buffer()
             self.serial.reset_output_buffer()
+            del self.byte_buffer[:]
             return self.status()
         match = re.match(self._status_regex, reply)
         if not match:
@@ -79,6 +79,18 @@ def test_connection_serial_read():
     dev.write(b'021.3' + term + b',054.2')
     assert dev.read() == '021.3'  # read until first `term`
     assert dev.read() == ',054.2'  # read until second `term`
+    assert len(dev.byte_buffer) == 0
+
+    dev.write(b'021.3' + term + b',054.2')
+    assert dev.read(3) == '021'
+    assert dev.read(5) == '.3' + term.decode() + ','
+    assert dev.read() == '054.2'  # read the rest -- removes the `term` at the end
+
+    # many replies are received in one chunk, the extra bytes are kept for the next read
+    dev.write(term.join(str(i).encode() for i in range(100)))
+    for i in range(100):
+        assert dev.read() == str(i)
+    assert len(dev.byte_buffer) == 0
 
     dev.write('SHUTDOWN')
 
@@ -114,6 +114,83 @@ def test_tcp_socket_read():
     dev.write('SHUTDOWN')
 
 
+def test_tcp_socket_read_many():
+
+    address = '127.0.0.1'
+    port = get_available_port()
+    term = b'\n'
+
+    t = threading.Thread(target=echo_server_tcp, args=(address, port, term))
+    t.start()
+
+    time.sleep(0.1)  # allow some time for the echo server to start
+
+    record = EquipmentRecord(
+        connection=ConnectionRecord(
+            address='TCP::{}::{}'.format(address, port),
+            backend=Backend.MSL,
+            properties=dict(
+                termination=term,
+                timeout=30
+            ),
+        )
+    )
+
+    dev = record.connect()
+
+    # a burst of many small replies
+    num = 100000
+    dev.write(term.join(str(i).encode() for i in range(num)))
+    for i in range(num):
+        assert dev.read() == str(i)
+    assert len(dev.byte_buffer) == 0
+
+    # replies that are split across many recv() calls
+    dev.write(b'a' * 10000 + term + b'b' * 10000 + term + b'c')
+    assert dev.read() == 'a' * 10000
+    assert dev.read(5) == 'bbbbb'
+    assert dev.read() == 'b' * 9995
+    assert dev.read() == 'c'
+    assert len(dev.byte_buffer) == 0
+
+    dev.write('SHUTDOWN')
+
+
+def test_tcp_socket_query_many():
+
+    address = '127.0.0.1'
+    port = get_available_port()
+    term = b'\r\n'
+
+    t = threading.Thread(target=echo_server_tcp, args=(address, port, term))
+    t.start()
+
+    time.sleep(0.1)  # allow some time for the echo server to start
+
+    record = EquipmentRecord(
+        connection=ConnectionRecord(
+            address='TCP::{}::{}'.format(address, port),
+            backend=Backend.MSL,
+            properties=dict(
+                termination=term,
+                timeout=30
+            ),
+        )
+    )
+
+    dev = record.connect()
+
+    assert dev.query_many([]) == []
+    assert dev.query_many(['hello']) == ['hello']
+
+    messages = ['VOLT?', 'CURR?', 'OUTP?', b'*IDN?', 'x'*5000]
+    assert dev.query_many(messages) == ['VOLT?', 'CURR?', 'OUTP?', '*IDN?', 'x'*5000]
+    assert dev.query_many(messages[:4], delay=0.1, separator=';') == ['VOLT?', 'CURR?', 'OUTP?', '*IDN?']
+    assert len(dev.byte_buffer) == 0
+
+    dev.write('SHUTDOWN')
+
+
 def test_tcp_socket_timeout():
 
     address = '127.0.0.1'